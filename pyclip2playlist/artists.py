@@ -0,0 +1,177 @@
+"""Artist canonicalization for PyClip2Playlist.
+
+Raw artist strings are split into featured and collaborating artists,
+case- and diacritic-folded and mapped to interned integer IDs, so grouping
+and counting songs by artist only needs integer operations.
+"""
+
+import re
+import sys
+import unicodedata
+from typing import Container, Dict, List, Optional, Tuple, Union
+
+# Explicit markers for featured or collaborating artists, e.g.
+#   Ned Doheny feat. X / Ned Doheny ft X / A x B / A vs. B
+# Only a lowercase "x" counts, so "Sam X Max" or "Racer X" stay intact.
+ARTIST_SEPARATOR = re.compile(
+    r'\s*(?:\b(?:featuring|feat|ft|vs)\b\.?|(?-i:\s+x\s+))\s*',
+    re.IGNORECASE
+)
+
+# List separators, applied after an explicit marker, and to the main artist
+# only if all pieces are known artists, since band names such as
+# "Earth, Wind & Fire" contain them, e.g.
+#   Ned Doheny feat. X & Y / Ned Doheny feat. X, Y / Ned Doheny & Y
+ARTIST_LIST_SEPARATOR = re.compile(r'\s*[,;&+]\s*')
+
+# Brackets around featured artists, e.g. "Artist (feat. X)"
+ARTIST_BRACKETS = re.compile(r'[()\[\]{}]')
+
+def _clean_artist(artist: str) -> str:
+    """Strip separators and surrounding punctuation from an artist piece."""
+    return artist.strip(" .-,;&+")
+
+def split_artists(artist: str, known: Optional[Container[str]] = None) -> List[str]:
+    """Split a raw artist string into the individual artists.
+
+    A featuring marker only splits if there is a name on both sides of it,
+    so "Little Feat" or "FT Island" stay intact. The main artist is split on
+    "&" or "," only if every piece is in ``known``, so names like
+    "Earth, Wind & Fire" or "Tyler, the Creator" stay intact.
+
+    Args:
+        artist: Raw artist string, e.g. "Ned Doheny feat. X & Y".
+        known: Folded names of registered artists, see ``fold_text``.
+
+    Returns:
+        List of artist names in order of appearance.
+    """
+    artist = ARTIST_BRACKETS.sub(' ', artist)
+    matches = list(ARTIST_SEPARATOR.finditer(artist))
+    pieces = []
+    start = 0
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(artist)
+        if _clean_artist(artist[start:match.start()]) and _clean_artist(artist[match.end():end]):
+            pieces.append(artist[start:match.start()])
+            start = match.end()
+    pieces.append(artist[start:])
+
+    main, *featured = pieces
+    parts = [main]
+    if known is not None:
+        collaborators = [_clean_artist(part) for part in ARTIST_LIST_SEPARATOR.split(main)]
+        if len(collaborators) > 1 and all(part and fold_text(part) in known
+                                          for part in collaborators):
+            parts = collaborators
+    for part in featured:
+        parts.extend(ARTIST_LIST_SEPARATOR.split(part))
+    parts = [_clean_artist(part) for part in parts]
+    parts = [part for part in parts if part]
+    if not parts and _clean_artist(artist):
+        # Nothing but separators, e.g. "Feat": keep the whole name
+        parts = [' '.join(artist.split())]
+    return parts
+
+def fold_text(text: str) -> str:
+    """Return the case- and diacritic-folded lookup key for a text.
+
+    Args:
+        text: A title or a single artist name.
+
+    Returns:
+        str: Folded key, e.g. "Beyoncé" -> "beyonce".
+    """
+    if text.isascii():
+        # Nothing to decompose, skip the per-character scan
+        return ' '.join(text.casefold().split())
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(stripped.casefold().split())
+
+# Artists are folded like any other text
+fold_artist = fold_text
+
+class ArtistTable:
+    """Memoized mapping from artist variants to interned canonical artist IDs."""
+
+    def __init__(self):
+        """Initialize an empty artist table."""
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._memo: Dict[str, Tuple[int, ...]] = {}
+
+    def artist_id(self, artist: str) -> int:
+        """Return the ID of a single artist, registering it if new.
+
+        The first seen spelling becomes the canonical display name.
+
+        Args:
+            artist: A single artist name.
+
+        Returns:
+            int: The canonical artist ID.
+        """
+        key = fold_text(artist)
+        artist_id = self._ids.get(key)
+        if artist_id is None:
+            artist_id = len(self.names)
+            self._ids[sys.intern(key)] = artist_id
+            self.names.append(sys.intern(' '.join(artist.split())))
+        return artist_id
+
+    def canonicalize(self, artist: str) -> Tuple[int, ...]:
+        """Return the canonical IDs of all artists in a raw artist string.
+
+        Results are memoized per raw string, so repeated variants cost a
+        single dictionary lookup.
+
+        Args:
+            artist: Raw artist string.
+
+        Returns:
+            Tuple of artist IDs, main artist first, without duplicates.
+        """
+        artist = str(artist)
+        ids = self._memo.get(artist)
+        if ids is None:
+            parts = split_artists(artist, self._ids)
+            ids = tuple(dict.fromkeys(self.artist_id(part) for part in parts))
+            # An unsplit "A & B" may split once A and B are registered
+            if not (parts and ARTIST_LIST_SEPARATOR.search(parts[0])):
+                self._memo[artist] = ids
+        return ids
+
+    def lookup(self, artist: str) -> Tuple[Union[int, str], ...]:
+        """Return the canonical IDs of a raw artist string without registering it.
+
+        Unknown artists are returned as their folded name, which never
+        equals a registered ID. Neither the table nor the memo grows.
+
+        Args:
+            artist: Raw artist string.
+
+        Returns:
+            Tuple of artist IDs or folded names, main artist first.
+        """
+        artist = str(artist)
+        ids = self._memo.get(artist)
+        if ids is not None:
+            return ids
+        keys = (fold_text(part) for part in split_artists(artist, self._ids))
+        return tuple(dict.fromkeys(self._ids.get(key, key) for key in keys))
+
+    def name(self, artist_id: int) -> str:
+        """Return the canonical display name of an artist ID.
+
+        Args:
+            artist_id: The canonical artist ID.
+
+        Returns:
+            str: The canonical artist name.
+        """
+        return self.names[artist_id]
+
+    def __len__(self) -> int:
+        """Return the number of distinct canonical artists."""
+        return len(self.names)
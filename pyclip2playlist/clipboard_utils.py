@@ -1,24 +1,235 @@
-"""Clipboard interaction utilities."""
+"""Clipboard interaction utilities.
+
+Clipboard access goes through a small backend layer so the GUI can read
+from Tk's own clipboard instead of spawning ``xclip``/``xsel`` through
+pyperclip on every refresh. ``ClipboardReader`` sits on top of a backend
+and skips redundant reads and normalization when the clipboard has not
+changed.
+"""
 
-import pyperclip
 import logging  # Added logging
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Hashable, Optional
+
+import pyperclip
+
+
+def normalize_clipboard_text(content) -> str:
+    """Normalize raw clipboard content to a clean unicode string.
+
+    Args:
+        content: Raw clipboard content as str or bytes.
+
+    Returns:
+        str: Content with unified line endings and without BOM.
+    """
+    # Ensure proper UTF-8 encoding
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+    # Normalize line endings
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    # Remove any BOM if present
+    content = content.replace('\ufeff', '')
+    return content
+
+
+class ClipboardBackend(ABC):
+    """Base class for clipboard backends."""
+
+    name = "base"
+
+    @abstractmethod
+    def read(self) -> str:
+        """Return the raw clipboard content.
+
+        Returns:
+            str: The raw clipboard content.
+        """
+
+    def change_token(self) -> Optional[Hashable]:
+        """Return a cheap token that changes whenever the clipboard changes.
+
+        Returns:
+            A hashable token, or None if the backend cannot detect changes
+            without reading the clipboard.
+        """
+        return None
+
+
+class PyperclipBackend(ClipboardBackend):
+    """Backend using pyperclip (runs xclip/xsel as a subprocess on Linux)."""
+
+    name = "pyperclip"
+
+    def __init__(self):
+        """Initialize the backend and the Windows sequence number lookup."""
+        self._sequence_number = None
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                self._sequence_number = ctypes.windll.user32.GetClipboardSequenceNumber
+            except Exception:
+                self._sequence_number = None
+
+    def read(self) -> str:
+        return pyperclip.paste()
+
+    def change_token(self) -> Optional[Hashable]:
+        if self._sequence_number is None:
+            return None
+        return self._sequence_number()
+
+
+class TkClipboardBackend(ClipboardBackend):
+    """Backend reading through Tk's ``clipboard_get`` of an existing root window."""
+
+    name = "tk"
+
+    def __init__(self, root):
+        """Initialize the backend.
+
+        Args:
+            root: The Tk root (or any widget) used to access the clipboard.
+        """
+        self.root = root
+
+    def read(self) -> str:
+        import tkinter as tk
+        try:
+            return self.root.clipboard_get()
+        except tk.TclError:
+            # Empty clipboard or content not available as text
+            return ""
+
+
+class FakeClipboardBackend(ClipboardBackend):
+    """In-memory backend for headless tests.
+
+    Every ``set_text`` bumps a sequence number that is used as change token.
+    An optional latency simulates slow backends.
+    """
+
+    name = "fake"
+
+    def __init__(self, text: str = "", latency: float = 0.0):
+        """Initialize the fake clipboard.
+
+        Args:
+            text: Initial clipboard content.
+            latency: Seconds each read should take.
+        """
+        self.text = text
+        self.latency = latency
+        self.sequence = 0
+        self.read_count = 0
+
+    def set_text(self, text: str) -> None:
+        """Replace the clipboard content.
+
+        Args:
+            text: New clipboard content.
+        """
+        self.text = text
+        self.sequence += 1
+
+    def read(self) -> str:
+        self.read_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.text
+
+    def change_token(self) -> Optional[Hashable]:
+        return self.sequence
+
+
+class ClipboardReader:
+    """Read clipboard content through a backend with change detection.
+
+    If the backend provides a change token, the clipboard is only read when
+    the token changes. Otherwise the raw content is read and compared with
+    the previous one, and normalization is skipped when it is unchanged.
+    """
+
+    def __init__(self, backend: ClipboardBackend):
+        """Initialize the reader.
+
+        Args:
+            backend: The clipboard backend to read from.
+        """
+        self.backend = backend
+        self.changed = False
+        self.error: Optional[Exception] = None
+        self._token = None
+        self._raw = None
+        self._content = None
+
+    def read(self) -> str:
+        """Return the current normalized clipboard content.
+
+        Sets ``changed`` to whether the content differs from the last read
+        and ``error`` to the exception of a failed read.
+
+        Returns:
+            str: The current clipboard content. On error, the last content
+            read successfully, or an empty string if there is none.
+        """
+        self.error = None
+        try:
+            token = self.backend.change_token()
+            if token is not None and token == self._token and self._content is not None:
+                self.changed = False
+                return self._content
+
+            raw = self.backend.read()
+            self._token = token
+            if raw == self._raw and self._content is not None:
+                self.changed = False
+                return self._content
+
+            self._raw = raw
+            self._content = normalize_clipboard_text(raw)
+            self.changed = True
+            return self._content
+        except Exception as e:
+            logging.error("Error reading clipboard (%s): %s", self.backend.name, e)
+            self.error = e
+            self.changed = False
+            return self._content if self._content is not None else ""
+
+    def poll(self) -> Optional[str]:
+        """Return the clipboard content if it changed since the last read.
+
+        Returns:
+            The new content, or None if the clipboard is unchanged.
+        """
+        content = self.read()
+        return content if self.changed else None
+
+
+def select_backend(root=None) -> ClipboardBackend:
+    """Return the best clipboard backend for the current environment.
+
+    Args:
+        root: Optional Tk root window; if given, Tk's clipboard is used.
+
+    Returns:
+        ClipboardBackend: Tk backend when a root exists, pyperclip otherwise.
+    """
+    if root is not None:
+        return TkClipboardBackend(root)
+    return PyperclipBackend()
+
 
 def load_clipboard() -> str:
     """Return the current content of the system clipboard.
-    
+
     Returns:
         str: The current clipboard content.
     """
     try:
-        content = pyperclip.paste()
-        # Ensure proper UTF-8 encoding
-        if isinstance(content, bytes):
-            content = content.decode('utf-8')
-        # Normalize line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        # Remove any BOM if present
-        content = content.replace('\ufeff', '')
-        return content
+        return normalize_clipboard_text(pyperclip.paste())
     except Exception as e:
         logging.error("Error reading clipboard: %s", e)
         return ""
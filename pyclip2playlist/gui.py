@@ -8,9 +8,10 @@ import csv
 import logging
 from pyclip2playlist.logger_setup import configure_logger
 
-from .clipboard_utils import load_clipboard
+from .clipboard_utils import ClipboardReader, select_backend
 from .song_extractor import extract_songs
 from .models import Song, SongCollection
+from .playlist_diff import diff_csv, save_delta_csv
 from . import gui_helpers  # Added helper import
 
 configure_logger()  # Configure logger once
@@ -40,6 +41,7 @@ class PyClip2PlaylistGUI:
         """Initialize the GUI application."""
         self.songs = SongCollection()
         self.setup_window()
+        self.clipboard = ClipboardReader(select_backend(self.root))
         self.setup_styles()
         gui_helpers.create_menu(self)
         gui_helpers.create_layout(self)
@@ -80,21 +82,29 @@ class PyClip2PlaylistGUI:
     
     def refresh_clipboard(self):
         """Refresh the clipboard content displayed in the text widget."""
-        content = load_clipboard()
+        content = self.clipboard.read()
+        if self.clipboard.error is not None:
+            self.status_var.set(f"Error reading clipboard: {self.clipboard.error}")
+            return
         content = self._normalize_text(content)
         self.clipboard_text.config(state='normal')
         self.clipboard_text.delete("1.0", tk.END)
         self.clipboard_text.insert(tk.END, content)
-        self.status_var.set("Clipboard updated.")
+        if self.clipboard.changed:
+            self.status_var.set("Clipboard updated.")
+        else:
+            self.status_var.set("Clipboard unchanged.")
     
     def extract_button(self):
         """Extract songs from the clipboard content and update the table."""
         content = self.clipboard_text.get("1.0", tk.END)
-        extracted = extract_songs(content)
-        self.songs = SongCollection()
+        artists = self.songs.artists
+        extracted = extract_songs(content, artists)
+        self.songs = SongCollection(artists)
         for song_dict in extracted:
             self.songs.add_song(Song(title=song_dict['TITLE'],
-                                   artist=song_dict['ARTIST']))
+                                   artist=song_dict['ARTIST'],
+                                   artist_ids=song_dict['ARTIST_IDS']))
         self.update_table()
         self.status_var.set(f"{len(self.songs)} song(s) extracted.")
     
@@ -149,13 +159,11 @@ class PyClip2PlaylistGUI:
             edit_entry.destroy()
             
             idx = self.tree.index(row)
-            vals = self.tree.item(row)['values']
-            if column == "#1":
-                new_song = Song(title=new_value, artist=vals[1])
-            elif column == "#2":
-                new_song = Song(title=vals[0], artist=new_value)
-            else:
-                new_song = Song(title=vals[0], artist=vals[1])
+            # item()['values'] converts numeric-looking cells, e.g. "+44" -> 44,
+            # while set() returns the cell text as stored
+            title = str(self.tree.set(row, '#1'))
+            artist = str(self.tree.set(row, '#2'))
+            new_song = Song(title=title, artist=artist)
                 
             self.songs.update_song(idx, new_song)
             self.status_var.set("Entry updated.")
@@ -190,6 +198,49 @@ class PyClip2PlaylistGUI:
             messagebox.showerror("Error", f"Error saving CSV: {e}")
             return False
     
+    def compare_csv_dialog(self):
+        """Show dialog to compare the song list with a saved CSV file."""
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV Files", "*.csv")],
+            title="Compare with CSV"
+        )
+        if filename:
+            self.compare_csv(filename)
+    
+    def compare_csv(self, filename: str):
+        """Compare the song list with a saved CSV file and show the changes.
+        
+        Args:
+            filename: Path to the saved CSV file.
+        """
+        try:
+            diff = diff_csv(filename, self.songs)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error reading CSV: {e}")
+            return None
+        gui_helpers.create_diff_window(self, diff)
+        self.status_var.set(f"Compared with {filename}: {diff.summary()}")
+        return diff
+    
+    def save_delta_dialog(self, diff):
+        """Show dialog to save only the changed songs as a CSV file.
+        
+        Args:
+            diff: The PlaylistDiff to export.
+        """
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv")],
+            title="Save delta CSV as"
+        )
+        if not filename:
+            return
+        try:
+            save_delta_csv(diff, filename)
+            self.status_var.set(f"Saved delta to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error saving CSV: {e}")
+    
     def run(self) -> None:
         """Run the GUI and handle unexpected errors."""
         try:
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import webbrowser
-from .clipboard_utils import load_clipboard
+from .playlist_diff import REMOVED
 
 SPOTIFY_IMPORTER_URL = "https://nickwanders.com/projects/ng-spotify-importer/"
 
@@ -15,6 +15,7 @@ def create_menu(gui):
     
     file_menu = tk.Menu(gui.menubar, tearoff=0)
     file_menu.add_command(label="Save CSV...", command=gui.save_csv_dialog)
+    file_menu.add_command(label="Compare with CSV...", command=gui.compare_csv_dialog)
     file_menu.add_separator()
     file_menu.add_command(label="Exit", command=gui.root.quit)
     gui.menubar.add_cascade(label="File", menu=file_menu)
@@ -42,7 +43,7 @@ def create_left_frame(gui):
     gui.clipboard_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
     # Configure text widget for UTF-8
     gui.clipboard_text.configure(font=('TkDefaultFont', 10))
-    content = load_clipboard()
+    content = gui.clipboard.read()
     if isinstance(content, bytes):
         content = content.decode('utf-8', errors='replace')
     else:
@@ -95,3 +96,36 @@ def create_status_bar(gui):
     gui.status_bar = ttk.Label(gui.root, textvariable=gui.status_var,
                                relief=tk.SUNKEN, anchor='w')
     gui.status_bar.pack(fill=tk.X, padx=10, pady=2, side=tk.BOTTOM)
+
+def create_diff_window(gui, diff):
+    """Create a window listing the changes of a playlist diff."""
+    window = tk.Toplevel(gui.root)
+    window.title("Playlist Changes")
+    window.geometry("800x400")
+    frame = ttk.Frame(window)
+    frame.pack(fill=tk.BOTH, expand=True)
+    ttk.Label(frame, text=diff.summary()).pack(anchor=tk.W)
+    tree_frame = ttk.Frame(frame)
+    tree_frame.pack(fill=tk.BOTH, expand=True)
+    tree = ttk.Treeview(tree_frame, columns=('STATUS', 'POSITION', 'TITLE', 'ARTIST', 'DETAILS'),
+                        show='headings', style="Treeview")
+    for column, text, width in (('STATUS', 'Status', 80), ('POSITION', '#', 50),
+                                ('TITLE', 'Title', 250), ('ARTIST', 'Artist', 180),
+                                ('DETAILS', 'Details', 220)):
+        tree.heading(column, text=text)
+        tree.column(column, anchor='w', width=width)
+    for entry in diff.entries:
+        row = entry.to_dict()
+        position = row['OLD_POSITION'] if entry.status == REMOVED else row['NEW_POSITION']
+        tree.insert('', tk.END, values=(entry.status, position, row['TITLE'],
+                                        row['ARTIST'], entry.details()))
+    vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=vsb.set)
+    vsb.pack(side='right', fill='y')
+    tree.pack(fill=tk.BOTH, expand=True)
+    buttons = ttk.Frame(frame)
+    buttons.pack(fill=tk.X, pady=5)
+    ttk.Button(buttons, text="Close", command=window.destroy).pack(side=tk.RIGHT, padx=5)
+    ttk.Button(buttons, text="Export Delta",
+               command=lambda: gui.save_delta_dialog(diff)).pack(side=tk.RIGHT, padx=5)
+    return window
@@ -1,13 +1,16 @@
 """Data models for PyClip2Playlist."""
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from .artists import ArtistTable
 
 @dataclass
 class Song:
-    """Represents a song with title and artist."""
+    """Represents a song with title, artist and canonical artist IDs."""
     title: str
     artist: str
+    artist_ids: Tuple[int, ...] = ()
 
     def to_dict(self) -> dict:
         """Convert the song to a dictionary format.
@@ -23,9 +26,24 @@ class Song:
 class SongCollection:
     """Manages a collection of songs."""
     
-    def __init__(self):
-        """Initialize an empty song collection."""
+    def __init__(self, artists: Optional[ArtistTable] = None):
+        """Initialize an empty song collection.
+        
+        Args:
+            artists: Artist table to share with other collections; a new
+                one is created if omitted.
+        """
         self.songs: List[Song] = []
+        self.artists = artists if artists is not None else ArtistTable()
+    
+    def _canonicalize(self, song: Song) -> Song:
+        """Fill in the canonical artist IDs of a song if missing."""
+        # Table cells may come back from Tk as numbers, e.g. artist "311"
+        song.title = str(song.title)
+        song.artist = str(song.artist)
+        if not song.artist_ids:
+            song.artist_ids = self.artists.canonicalize(song.artist)
+        return song
     
     def add_song(self, song: Song) -> None:
         """Add a song to the collection.
@@ -33,7 +51,7 @@ class SongCollection:
         Args:
             song: The Song object to add.
         """
-        self.songs.append(song)
+        self.songs.append(self._canonicalize(song))
     
     def remove_song(self, index: int) -> None:
         """Remove a song at the specified index.
@@ -52,7 +70,30 @@ class SongCollection:
             song: New Song object.
         """
         if 0 <= index < len(self.songs):
-            self.songs[index] = song
+            self.songs[index] = self._canonicalize(song)
+    
+    def artist_counts(self) -> Counter:
+        """Count songs per canonical artist, including featured artists.
+        
+        Returns:
+            Counter mapping artist IDs to the number of songs.
+        """
+        counts = Counter()
+        for song in self.songs:
+            counts.update(song.artist_ids)
+        return counts
+    
+    def group_by_artist(self) -> Dict[int, List[int]]:
+        """Group song indices by canonical artist ID.
+        
+        Returns:
+            Dictionary mapping artist IDs to the indices of their songs.
+        """
+        groups: Dict[int, List[int]] = {}
+        for index, song in enumerate(self.songs):
+            for artist_id in song.artist_ids:
+                groups.setdefault(artist_id, []).append(index)
+        return groups
     
     def to_dict_list(self) -> List[dict]:
         """Convert all songs to a list of dictionaries.
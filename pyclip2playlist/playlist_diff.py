@@ -0,0 +1,431 @@
+"""Playlist diff between a saved CSV and the current song collection.
+
+Songs are matched by a normalized key (folded title plus canonical artist
+IDs), so each side is hashed once and the comparison runs in linear time
+apart from the move detection, which is O(n log n).
+"""
+
+import argparse
+import csv
+import sys
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import islice
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .artists import fold_text
+from .models import Song, SongCollection
+from .song_extractor import extract_songs
+
+ADDED = 'added'
+REMOVED = 'removed'
+MOVED = 'moved'
+EDITED = 'edited'
+
+# Minimum similarity of two titles by the same artist to count as an edit,
+# e.g. "Summer Breez" -> "Summer Breeze", and the number of unpaired songs
+# by that artist compared per song, which keeps the pairing linear
+TITLE_SIMILARITY = 0.8
+MAX_TITLE_CANDIDATES = 8
+
+DELTA_FIELDNAMES = ['TITLE', 'ARTIST', 'STATUS', 'OLD_TITLE', 'OLD_ARTIST',
+                    'OLD_POSITION', 'NEW_POSITION']
+
+@dataclass
+class DiffEntry:
+    """A single change between the saved and the current playlist."""
+    status: str
+    song: Song
+    old_index: Optional[int] = None
+    new_index: Optional[int] = None
+    old_song: Optional[Song] = None
+
+    def to_dict(self) -> dict:
+        """Convert the entry to a dictionary for the delta CSV.
+
+        Returns:
+            dict: Dictionary with the DELTA_FIELDNAMES keys; positions are 1-based.
+        """
+        return {
+            'TITLE': self.song.title,
+            'ARTIST': self.song.artist,
+            'STATUS': self.status,
+            'OLD_TITLE': self.old_song.title if self.old_song else '',
+            'OLD_ARTIST': self.old_song.artist if self.old_song else '',
+            'OLD_POSITION': '' if self.old_index is None else self.old_index + 1,
+            'NEW_POSITION': '' if self.new_index is None else self.new_index + 1,
+        }
+
+    def details(self) -> str:
+        """Describe the previous state of a moved or edited song.
+
+        Returns:
+            str: Text such as "was 3" or "was Title - Artist", empty otherwise.
+        """
+        if self.status == MOVED:
+            return f"was {self.old_index + 1}"
+        if self.status == EDITED:
+            return f"was {self.old_song.title} - {self.old_song.artist}"
+        return ''
+
+class PlaylistDiff:
+    """Result of comparing a saved playlist with the current one."""
+
+    def __init__(self, entries: List[DiffEntry]):
+        """Initialize the diff.
+
+        Args:
+            entries: All changes, ordered by position in the new playlist
+                with removed songs last.
+        """
+        self.entries = entries
+
+    def by_status(self, status: str) -> List[DiffEntry]:
+        """Return all entries with the given status.
+
+        Args:
+            status: One of ADDED, REMOVED, MOVED or EDITED.
+
+        Returns:
+            List of matching entries.
+        """
+        return [entry for entry in self.entries if entry.status == status]
+
+    @property
+    def added(self) -> List[DiffEntry]:
+        """Return the added songs."""
+        return self.by_status(ADDED)
+
+    @property
+    def removed(self) -> List[DiffEntry]:
+        """Return the removed songs."""
+        return self.by_status(REMOVED)
+
+    @property
+    def moved(self) -> List[DiffEntry]:
+        """Return the moved songs."""
+        return self.by_status(MOVED)
+
+    @property
+    def edited(self) -> List[DiffEntry]:
+        """Return the edited songs."""
+        return self.by_status(EDITED)
+
+    def summary(self) -> str:
+        """Return a one-line summary of the change counts."""
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.moved)} moved, {len(self.edited)} edited")
+
+    def __len__(self) -> int:
+        """Return the number of changes."""
+        return len(self.entries)
+
+def iter_csv_songs(filename: str) -> Iterator[Song]:
+    """Stream songs from a CSV file written by ``save_csv``.
+
+    Args:
+        filename: Path to the CSV file with TITLE and ARTIST columns.
+
+    Yields:
+        Song objects in file order.
+
+    Raises:
+        ValueError: If the file has no TITLE or ARTIST column.
+    """
+    with open(filename, newline='', encoding='utf-8-sig') as csvfile:
+        reader = csv.DictReader(csvfile)
+        missing = [name for name in ('TITLE', 'ARTIST') if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{filename}: missing column(s) {', '.join(missing)}")
+        for row in reader:
+            yield Song(title=row['TITLE'] or '', artist=row['ARTIST'] or '')
+
+def _stable_positions(old_indices: Sequence[int]) -> List[bool]:
+    """Mark the songs that keep their relative order.
+
+    Computes a longest increasing subsequence of the old indices taken in
+    new order; every matched song outside of it counts as moved.
+
+    Args:
+        old_indices: Old index of each matched song, in new order.
+
+    Returns:
+        List of flags, True for songs that did not move.
+    """
+    tails: List[int] = []
+    tail_pos: List[int] = []
+    previous: List[int] = [-1] * len(old_indices)
+    for pos, value in enumerate(old_indices):
+        i = bisect_left(tails, value)
+        if i > 0:
+            previous[pos] = tail_pos[i - 1]
+        if i == len(tails):
+            tails.append(value)
+            tail_pos.append(pos)
+        else:
+            tails[i] = value
+            tail_pos[i] = pos
+    stable = [False] * len(old_indices)
+    pos = tail_pos[-1] if tail_pos else -1
+    while pos != -1:
+        stable[pos] = True
+        pos = previous[pos]
+    return stable
+
+def _pair_edits(new_songs: SongCollection, new_titles: List[str], match: List[Optional[int]],
+                old_titles: List[str], old_artists: List[str],
+                old_matched: List[bool]) -> Dict[int, int]:
+    """Pair leftover songs of both sides that are edits of each other.
+
+    Leftover songs are paired by folded title first (the artist changed),
+    then by artist IDs if the titles are similar (the title changed).
+    Paired old songs are marked in ``old_matched``.
+
+    Returns:
+        Dictionary mapping new indices to the paired old indices.
+    """
+    pairs: Dict[int, int] = {}
+    unmatched = [new_index for new_index, old_index in enumerate(match) if old_index is None]
+    if not unmatched:
+        return pairs
+
+    # Each key maps to an old index, or to a deque of them for duplicates
+    artists = new_songs.artists
+    old_artist_ids: Dict[str, Tuple[Hashable, ...]] = {}
+    by_title: Dict[str, Union[int, deque]] = {}
+    by_artist: Dict[Tuple[Hashable, ...], Union[int, deque]] = {}
+
+    def add(index: Dict, key: Hashable, old_index: int) -> None:
+        current = index.get(key)
+        if current is None:
+            index[key] = old_index
+        elif isinstance(current, deque):
+            current.append(old_index)
+        else:
+            index[key] = deque((current, old_index))
+
+    def unpaired(index: Dict, key: Hashable) -> deque:
+        # Drop songs that were paired already, possibly through the other index
+        current = index.get(key)
+        if current is None:
+            return deque()
+        if not isinstance(current, deque):
+            current = index[key] = deque((current,))
+        while current and old_matched[current[0]]:
+            current.popleft()
+        return current
+
+    for old_index, matched_old in enumerate(old_matched):
+        if not matched_old:
+            add(by_title, fold_text(old_titles[old_index]), old_index)
+            old_artist = old_artists[old_index]
+            artist_ids = old_artist_ids.get(old_artist)
+            if artist_ids is None:
+                artist_ids = old_artist_ids[old_artist] = artists.lookup(old_artist)
+            if artist_ids:
+                add(by_artist, artist_ids, old_index)
+    old_artist_ids.clear()
+
+    for new_index in unmatched:
+        queue = unpaired(by_title, new_titles[new_index])
+        if queue:
+            pairs[new_index] = old_index = queue.popleft()
+            old_matched[old_index] = True
+    for new_index in unmatched:
+        if new_index in pairs:
+            continue
+        queue = unpaired(by_artist, new_songs.songs[new_index].artist_ids)
+        for old_index in islice(queue, MAX_TITLE_CANDIDATES):
+            if old_matched[old_index]:
+                continue
+            similarity = SequenceMatcher(None, fold_text(old_titles[old_index]),
+                                         new_titles[new_index]).ratio()
+            if similarity >= TITLE_SIMILARITY:
+                pairs[new_index] = old_index
+                old_matched[old_index] = True
+                break
+    return pairs
+
+def diff_songs(old_songs: Iterable[Song], new_songs: SongCollection) -> PlaylistDiff:
+    """Compare a saved playlist with the current song collection.
+
+    Songs with the same normalized key are matched in order. Matched songs
+    whose raw title or artist differ are reported as edited; matched songs
+    that left their relative order as moved. Leftover songs with the same
+    title (the artist changed), or by the same artist with a similar title
+    (the title changed), are reported as edited as well; any other
+    leftover songs are added or removed.
+
+    The saved playlist is keyed with read-only lookups, so comparing does
+    not add its artists to the collection's artist table.
+
+    Args:
+        old_songs: Songs of the saved playlist, e.g. from ``iter_csv_songs``.
+        new_songs: The current song collection.
+
+    Returns:
+        PlaylistDiff with all changes.
+    """
+    artists = new_songs.artists
+    # Local memo for the saved side, freed once the diff is done
+    old_artist_ids: Dict[str, Tuple[Hashable, ...]] = {}
+    old_titles: List[str] = []
+    old_artists: List[str] = []
+    # First position of each key; later duplicates are queued separately
+    positions: Dict[Tuple[str, Tuple[Hashable, ...]], int] = {}
+    duplicates: Dict[Tuple[str, Tuple[Hashable, ...]], deque] = {}
+    for index, song in enumerate(old_songs):
+        artist_ids = old_artist_ids.get(song.artist)
+        if artist_ids is None:
+            artist_ids = old_artist_ids[song.artist] = artists.lookup(song.artist)
+        key = (fold_text(song.title), artist_ids)
+        old_titles.append(song.title)
+        old_artists.append(song.artist)
+        if positions.setdefault(key, index) != index:
+            duplicates.setdefault(key, deque()).append(index)
+    old_artist_ids.clear()
+
+    new_list = new_songs.songs
+    new_titles = [fold_text(song.title) for song in new_list]
+    match: List[Optional[int]] = [None] * len(new_list)
+    old_matched = [False] * len(old_titles)
+    for new_index, song in enumerate(new_list):
+        key = (new_titles[new_index], song.artist_ids)
+        old_index = positions.pop(key, None)
+        if old_index is None:
+            continue
+        queue = duplicates.get(key)
+        if queue:
+            positions[key] = queue.popleft()
+        match[new_index] = old_index
+        old_matched[old_index] = True
+    positions.clear()
+    duplicates.clear()
+
+    matched = [new_index for new_index, old_index in enumerate(match) if old_index is not None]
+    stable = _stable_positions([match[new_index] for new_index in matched])
+    moved = {new_index for new_index, keep in zip(matched, stable) if not keep}
+    edits = _pair_edits(new_songs, new_titles, match, old_titles, old_artists, old_matched)
+
+    entries: List[DiffEntry] = []
+    for new_index, song in enumerate(new_list):
+        old_index = match[new_index]
+        if old_index is None:
+            old_index = edits.get(new_index)
+            if old_index is None:
+                entries.append(DiffEntry(ADDED, song, new_index=new_index))
+            else:
+                old_song = Song(title=old_titles[old_index], artist=old_artists[old_index])
+                entries.append(DiffEntry(EDITED, song, old_index, new_index, old_song))
+            continue
+        old_title, old_artist = old_titles[old_index], old_artists[old_index]
+        if old_title != song.title or old_artist != song.artist:
+            old_song = Song(title=old_title, artist=old_artist)
+            entries.append(DiffEntry(EDITED, song, old_index, new_index, old_song))
+        elif new_index in moved:
+            old_song = Song(title=old_title, artist=old_artist)
+            entries.append(DiffEntry(MOVED, song, old_index, new_index, old_song))
+
+    for old_index, matched_old in enumerate(old_matched):
+        if not matched_old:
+            old_song = Song(title=old_titles[old_index], artist=old_artists[old_index])
+            entries.append(DiffEntry(REMOVED, old_song, old_index=old_index))
+    return PlaylistDiff(entries)
+
+def diff_csv(filename: str, new_songs: SongCollection) -> PlaylistDiff:
+    """Compare a saved CSV file with the current song collection.
+
+    Args:
+        filename: Path to the CSV file written by ``save_csv``.
+        new_songs: The current song collection.
+
+    Returns:
+        PlaylistDiff with all changes.
+    """
+    return diff_songs(iter_csv_songs(filename), new_songs)
+
+def save_delta_csv(diff: PlaylistDiff, filename: str) -> None:
+    """Write only the changed songs to a CSV file.
+
+    Args:
+        diff: The playlist diff to export.
+        filename: Path to save the CSV file.
+    """
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=DELTA_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(entry.to_dict() for entry in diff.entries)
+
+def format_entry(entry: DiffEntry) -> str:
+    """Format a diff entry as a single line of text.
+
+    Args:
+        entry: The diff entry.
+
+    Returns:
+        str: Line such as "+ 3. Summer Breeze - Piper".
+    """
+    markers = {ADDED: '+', REMOVED: '-', MOVED: '>', EDITED: '~'}
+    index = entry.old_index if entry.status == REMOVED else entry.new_index
+    line = f"{markers[entry.status]} {index + 1}. {entry.song.title} - {entry.song.artist}"
+    details = entry.details()
+    if details:
+        line += f" ({details})"
+    return line
+
+def load_songs(filename: str) -> SongCollection:
+    """Load the current playlist from a CSV file or a plain text tracklist.
+
+    Args:
+        filename: Path to a CSV file or a text file to extract songs from.
+
+    Returns:
+        SongCollection with the loaded songs.
+    """
+    songs = SongCollection()
+    if filename.lower().endswith('.csv'):
+        for song in iter_csv_songs(filename):
+            songs.add_song(song)
+    else:
+        with open(filename, encoding='utf-8') as textfile:
+            text = textfile.read()
+        for song_dict in extract_songs(text, songs.artists):
+            songs.add_song(Song(title=song_dict['TITLE'],
+                                artist=song_dict['ARTIST'],
+                                artist_ids=song_dict['ARTIST_IDS']))
+    return songs
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compare a saved CSV playlist with a new tracklist from the command line.
+
+    Returns:
+        int: 0 if the playlists are equal, 1 if they differ, 2 on errors.
+    """
+    parser = argparse.ArgumentParser(
+        prog='pyclip2playlist-diff',
+        description="Compare a saved CSV playlist with a new tracklist."
+    )
+    parser.add_argument('old', help="CSV file saved by PyClip2Playlist")
+    parser.add_argument('new', help="new CSV file or text tracklist")
+    parser.add_argument('-o', '--export', metavar='CSV',
+                        help="write only the changed songs to this CSV file")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="only print the summary")
+    args = parser.parse_args(argv)
+
+    try:
+        diff = diff_csv(args.old, load_songs(args.new))
+        if args.export:
+            save_delta_csv(diff, args.export)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"pyclip2playlist-diff: error: {e}", file=sys.stderr)
+        return 2
+    if not args.quiet:
+        for entry in diff.entries:
+            print(format_entry(entry))
+    print(diff.summary())
+    return 1 if len(diff) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """Song extraction functionality."""
 
 from typing import List, Tuple, Dict, Optional
+from .artists import ArtistTable
 from .models import Song
 from .patterns import patterns
 import logging
@@ -55,7 +56,14 @@ def clean_text(text: str) -> str:
     
     return text
 
-def extract_songs(text: str) -> List[Dict[str, str]]:
+def _song_dict(song: Song, artists: Optional[ArtistTable]) -> Dict:
+    """Convert an extracted song to a dictionary, adding artist IDs if requested."""
+    song_dict = song.to_dict()
+    if artists is not None:
+        song_dict['ARTIST_IDS'] = artists.canonicalize(song.artist)
+    return song_dict
+
+def extract_songs(text: str, artists: Optional[ArtistTable] = None) -> List[Dict]:
     """Extract songs (title and artist) from text.
     
     The function tries regex patterns first; if none match, falls back to heuristic extraction.
@@ -63,6 +71,8 @@ def extract_songs(text: str) -> List[Dict[str, str]]:
     
     Args:
         text: Input text containing song information.
+        artists: Optional artist table; if given, each dictionary also gets an
+            'ARTIST_IDS' key with the canonical artist IDs.
         
     Returns:
         List of dictionaries, each containing 'TITLE' and 'ARTIST' keys.
@@ -87,7 +97,7 @@ def extract_songs(text: str) -> List[Dict[str, str]]:
                 title = match.group('track').strip()
                 artist = match.group('artist').strip()
                 song = Song(title=title, artist=artist)
-                extracted.append(song.to_dict())
+                extracted.append(_song_dict(song, artists))
                 matched = True
                 break
 
@@ -96,13 +106,13 @@ def extract_songs(text: str) -> List[Dict[str, str]]:
             title, artist = fallback_extraction(line)
             if title and artist:
                 song = Song(title=title, artist=artist)
-                extracted.append(song.to_dict())
+                extracted.append(_song_dict(song, artists))
                 matched = True
 
         # Use entire line as title if all extraction methods failed
         if not matched:
             song = Song(title=line, artist="Unknown")
-            extracted.append(song.to_dict())
+            extracted.append(_song_dict(song, artists))
             logging.warning("Fallback: Using entire line as title: %s", original_line)
 
     return extracted
@@ -0,0 +1,118 @@
+"""Test suite for artist canonicalization functionality."""
+
+import unittest
+from pyclip2playlist.artists import ArtistTable, fold_artist, split_artists
+from pyclip2playlist.models import Song, SongCollection
+from pyclip2playlist.song_extractor import extract_songs
+
+class TestArtists(unittest.TestCase):
+    """Test cases for artist splitting, folding and interning."""
+
+    def test_split_featured_artists(self):
+        """Test splitting featured and collaborating artists."""
+        self.assertEqual(split_artists('Ned Doheny feat. X'), ['Ned Doheny', 'X'])
+        self.assertEqual(split_artists('Ned Doheny ft Y'), ['Ned Doheny', 'Y'])
+        self.assertEqual(split_artists('Ned Doheny (featuring X)'), ['Ned Doheny', 'X'])
+        self.assertEqual(split_artists('Ned Doheny feat. Y & Z'), ['Ned Doheny', 'Y', 'Z'])
+        self.assertEqual(split_artists('Ned Doheny ft. Y, Z'), ['Ned Doheny', 'Y', 'Z'])
+        self.assertEqual(split_artists('A x B'), ['A', 'B'])
+
+    def test_split_keeps_plain_names(self):
+        """Test that names containing separator letters stay intact."""
+        self.assertEqual(split_artists('Malcolm X'), ['Malcolm X'])
+        self.assertEqual(split_artists('Piper'), ['Piper'])
+
+    def test_split_keeps_band_names(self):
+        """Test that commas and ampersands in band names do not split."""
+        self.assertEqual(split_artists('Earth, Wind & Fire'), ['Earth, Wind & Fire'])
+        self.assertEqual(split_artists('Tyler, the Creator'), ['Tyler, the Creator'])
+        self.assertEqual(split_artists('Earth, Wind & Fire feat. The Emotions'),
+                         ['Earth, Wind & Fire', 'The Emotions'])
+
+    def test_split_keeps_names_with_markers(self):
+        """Test that markers without a name on both sides do not split."""
+        self.assertEqual(split_artists('Little Feat'), ['Little Feat'])
+        self.assertEqual(split_artists('FT Island'), ['FT Island'])
+        self.assertEqual(split_artists('Feat'), ['Feat'])
+        self.assertEqual(split_artists('Sam X Max'), ['Sam X Max'])
+        self.assertEqual(split_artists('Racer X & Co'), ['Racer X & Co'])
+        self.assertEqual(split_artists('Little Feat feat. X'), ['Little Feat', 'X'])
+        self.assertEqual(split_artists('FT Island ft. X'), ['FT Island', 'X'])
+
+    def test_marker_names_keep_ids(self):
+        """Test that artists named like markers are counted under their own name."""
+        songs = SongCollection()
+        songs.add_song(Song(title='Dixie Chicken', artist='Little Feat'))
+        songs.add_song(Song(title='Song', artist='Feat'))
+        self.assertEqual([songs.artists.name(i) for s in songs.songs for i in s.artist_ids],
+                         ['Little Feat', 'Feat'])
+        self.assertEqual(sum(songs.artist_counts().values()), 2)
+
+    def test_split_known_collaborators(self):
+        """Test that "&" splits the main artist only into registered artists."""
+        table = ArtistTable()
+        ned, y = table.canonicalize('Ned Doheny')[0], table.canonicalize('Y')[0]
+        self.assertEqual(table.canonicalize('Ned Doheny & Y'), (ned, y))
+        self.assertEqual(table.lookup('ned doheny & y'), (ned, y))
+        table.canonicalize('Earth')
+        table.canonicalize('Wind')
+        self.assertEqual(table.name(table.canonicalize('Earth, Wind & Fire')[0]),
+                         'Earth, Wind & Fire')
+
+    def test_fold_artist(self):
+        """Test case and diacritic folding."""
+        self.assertEqual(fold_artist('Beyoncé'), 'beyonce')
+        self.assertEqual(fold_artist('  NED   Doheny '), 'ned doheny')
+
+    def test_variants_share_id(self):
+        """Test that artist variants map to the same canonical ID."""
+        table = ArtistTable()
+        main_id = table.canonicalize('Ned Doheny')[0]
+        self.assertEqual(table.canonicalize('ned doheny'), (main_id,))
+        self.assertEqual(table.canonicalize('Ned Doheny feat. X')[0], main_id)
+        self.assertEqual(table.canonicalize('Ned Doheny ft Y')[0], main_id)
+        self.assertEqual(table.name(main_id), 'Ned Doheny')
+        self.assertEqual(len(table), 3)
+
+    def test_duplicate_artists_removed(self):
+        """Test that an artist listed twice appears once."""
+        table = ArtistTable()
+        self.assertEqual(len(table.canonicalize('Piper feat. PIPER')), 1)
+
+    def test_extract_songs_with_artist_table(self):
+        """Test that extract_songs adds artist IDs when given a table."""
+        table = ArtistTable()
+        result = extract_songs('Each Time You Pray - Ned Doheny feat. X', table)
+        self.assertEqual(result[0]['ARTIST'], 'Ned Doheny feat. X')
+        self.assertEqual([table.name(i) for i in result[0]['ARTIST_IDS']], ['Ned Doheny', 'X'])
+
+    def test_collection_counts_and_groups(self):
+        """Test artist counts and grouping in a song collection."""
+        songs = SongCollection()
+        songs.add_song(Song(title='A', artist='Ned Doheny'))
+        songs.add_song(Song(title='B', artist='ned doheny feat. Y'))
+        songs.add_song(Song(title='C', artist='Y'))
+        ned, y = songs.songs[1].artist_ids
+        self.assertEqual(songs.artist_counts(), {ned: 2, y: 2})
+        self.assertEqual(songs.group_by_artist(), {ned: [0, 1], y: [1, 2]})
+        self.assertEqual(songs.to_dict_list()[1], {'TITLE': 'B', 'ARTIST': 'ned doheny feat. Y'})
+
+    def test_update_song_recomputes_ids(self):
+        """Test that updating a song canonicalizes the new artist."""
+        songs = SongCollection()
+        songs.add_song(Song(title='A', artist='Piper'))
+        songs.update_song(0, Song(title='A', artist='Omaesan'))
+        self.assertEqual(songs.artists.name(songs.songs[0].artist_ids[0]), 'Omaesan')
+
+    def test_update_song_numeric_artist(self):
+        """Test editing a song whose artist cell Tk returned as int."""
+        songs = SongCollection()
+        songs.add_song(Song(title='Down', artist='311'))
+        songs.update_song(0, Song(title='Down (Live)', artist=311))
+        self.assertEqual(songs.songs[0].artist, '311')
+        self.assertEqual(len(songs.songs[0].artist_ids), 1)
+        self.assertEqual(songs.artists.name(songs.songs[0].artist_ids[0]), '311')
+        self.assertEqual(songs.to_dict_list(), [{'TITLE': 'Down (Live)', 'ARTIST': '311'}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Test suite for clipboard access functionality."""
+
+import time
+import unittest
+from pyclip2playlist.clipboard_utils import (
+    ClipboardBackend, ClipboardReader, FakeClipboardBackend, PyperclipBackend,
+    TkClipboardBackend, normalize_clipboard_text, select_backend
+)
+
+class TokenlessBackend(ClipboardBackend):
+    """Backend without change token, like the Tk backend."""
+
+    def __init__(self, text):
+        self.text = text
+
+    def read(self):
+        return self.text
+
+class FailingBackend(ClipboardBackend):
+    """Backend whose reads fail once ``fail`` is set."""
+
+    def __init__(self, text='', fail=True):
+        self.text = text
+        self.fail = fail
+
+    def read(self):
+        if self.fail:
+            raise RuntimeError("clipboard unavailable")
+        return self.text
+
+class TestClipboardUtils(unittest.TestCase):
+    """Test cases for clipboard backends and change detection."""
+
+    def test_normalize_clipboard_text(self):
+        """Test line ending, BOM and bytes normalization."""
+        self.assertEqual(normalize_clipboard_text('\ufeffa\r\nb\rc'), 'a\nb\nc')
+        self.assertEqual(normalize_clipboard_text('x\r\ny'.encode('utf-8')), 'x\ny')
+
+    def test_reader_normalizes_content(self):
+        """Test that the reader returns normalized content."""
+        reader = ClipboardReader(FakeClipboardBackend('A - B\r\nC - D'))
+        self.assertEqual(reader.read(), 'A - B\nC - D')
+        self.assertTrue(reader.changed)
+
+    def test_unchanged_token_skips_read(self):
+        """Test that an unchanged change token avoids reading the backend."""
+        backend = FakeClipboardBackend('Title - Artist')
+        reader = ClipboardReader(backend)
+        reader.read()
+        reader.read()
+        reader.read()
+        self.assertEqual(backend.read_count, 1)
+        self.assertFalse(reader.changed)
+
+    def test_changed_token_reads_again(self):
+        """Test that setting new content triggers a new read."""
+        backend = FakeClipboardBackend('Old - Song')
+        reader = ClipboardReader(backend)
+        reader.read()
+        backend.set_text('New - Song')
+        self.assertEqual(reader.read(), 'New - Song')
+        self.assertTrue(reader.changed)
+        self.assertEqual(backend.read_count, 2)
+
+    def test_same_content_with_new_token_is_unchanged(self):
+        """Test that rewriting identical content is not reported as change."""
+        backend = FakeClipboardBackend('Same - Song')
+        reader = ClipboardReader(backend)
+        reader.read()
+        backend.set_text('Same - Song')
+        self.assertEqual(reader.read(), 'Same - Song')
+        self.assertFalse(reader.changed)
+
+    def test_content_detection_without_token(self):
+        """Test content-based change detection for backends without token."""
+        backend = TokenlessBackend('A - B')
+        reader = ClipboardReader(backend)
+        self.assertEqual(reader.poll(), 'A - B')
+        self.assertIsNone(reader.poll())
+        backend.text = 'C - D'
+        self.assertEqual(reader.poll(), 'C - D')
+
+    def test_cached_read_latency(self):
+        """Test that unchanged reads do not pay the backend latency."""
+        backend = FakeClipboardBackend('Title - Artist', latency=0.05)
+        reader = ClipboardReader(backend)
+        reader.read()
+        start = time.perf_counter()
+        for _ in range(10):
+            reader.read()
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+    def test_backend_error_returns_empty(self):
+        """Test that backend errors without cached content result in empty content."""
+        reader = ClipboardReader(FailingBackend())
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(reader.read(), '')
+        self.assertFalse(reader.changed)
+        self.assertIsInstance(reader.error, RuntimeError)
+
+    def test_backend_error_keeps_cached_content(self):
+        """Test that backend errors return the last content and expose the error."""
+        backend = FailingBackend('A - B', fail=False)
+        reader = ClipboardReader(backend)
+        self.assertEqual(reader.read(), 'A - B')
+        self.assertIsNone(reader.error)
+        backend.fail = True
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(reader.read(), 'A - B')
+        self.assertFalse(reader.changed)
+        self.assertIsNotNone(reader.error)
+        backend.fail = False
+        reader.read()
+        self.assertIsNone(reader.error)
+
+    def test_base_backend_is_abstract(self):
+        """Test that the base backend cannot be instantiated."""
+        with self.assertRaises(TypeError):
+            ClipboardBackend()
+
+    def test_select_backend(self):
+        """Test backend selection with and without a Tk root."""
+        self.assertIsInstance(select_backend(), PyperclipBackend)
+        self.assertIsInstance(select_backend(object()), TkClipboardBackend)
+
+if __name__ == '__main__':
+    unittest.main()
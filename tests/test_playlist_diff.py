@@ -0,0 +1,177 @@
+"""Test suite for playlist diff functionality."""
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+from pyclip2playlist.models import Song, SongCollection
+from pyclip2playlist.playlist_diff import (
+    ADDED, EDITED, MOVED, REMOVED, diff_csv, diff_songs, format_entry, iter_csv_songs,
+    main, save_delta_csv
+)
+
+def make_collection(pairs):
+    """Build a song collection from (title, artist) pairs."""
+    songs = SongCollection()
+    for title, artist in pairs:
+        songs.add_song(Song(title=title, artist=artist))
+    return songs
+
+def make_songs(pairs):
+    """Build a list of songs from (title, artist) pairs."""
+    return [Song(title=title, artist=artist) for title, artist in pairs]
+
+class TestPlaylistDiff(unittest.TestCase):
+    """Test cases for comparing playlists."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_csv(self, name, pairs):
+        """Write a CSV file like save_csv does and return its path."""
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=['TITLE', 'ARTIST'])
+            writer.writeheader()
+            writer.writerows({'TITLE': t, 'ARTIST': a} for t, a in pairs)
+        return path
+
+    def test_identical_playlists(self):
+        """Test that identical playlists have no changes."""
+        pairs = [('Skate Dancer', 'Doug Willis'), ('Summer Breeze', 'Piper')]
+        diff = diff_songs(make_songs(pairs), make_collection(pairs))
+        self.assertEqual(len(diff), 0)
+
+    def test_added_and_removed(self):
+        """Test detection of added and removed songs."""
+        old = make_songs([('A', 'X'), ('B', 'Y'), ('C', 'Z')])
+        new = make_collection([('A', 'X'), ('C', 'Z'), ('D', 'W')])
+        diff = diff_songs(old, new)
+        self.assertEqual([(e.song.title, e.new_index) for e in diff.added], [('D', 2)])
+        self.assertEqual([(e.song.title, e.old_index) for e in diff.removed], [('B', 1)])
+        self.assertEqual(diff.moved, [])
+
+    def test_moved(self):
+        """Test that only the moved song is reported as moved."""
+        old = make_songs([('A', 'X'), ('B', 'Y'), ('C', 'Z'), ('D', 'W')])
+        new = make_collection([('B', 'Y'), ('C', 'Z'), ('D', 'W'), ('A', 'X')])
+        diff = diff_songs(old, new)
+        self.assertEqual([(e.song.title, e.old_index, e.new_index) for e in diff.moved],
+                         [('A', 0, 3)])
+        self.assertEqual(diff.summary(), "0 added, 0 removed, 1 moved, 0 edited")
+
+    def test_edited_normalized_match(self):
+        """Test that spelling variants of the same song are reported as edited."""
+        old = make_songs([('Each Time You Pray', 'ned doheny')])
+        new = make_collection([('Each time you pray', 'Ned Doheny')])
+        diff = diff_songs(old, new)
+        self.assertEqual(len(diff.edited), 1)
+        self.assertEqual(diff.edited[0].old_song.artist, 'ned doheny')
+        self.assertEqual(diff.removed, [])
+
+    def test_edited_same_position(self):
+        """Test that a changed artist at the same position is reported as edited."""
+        old = make_songs([('Summer Breeze', 'Pipr'), ('A', 'X')])
+        new = make_collection([('Summer Breeze', 'Piper'), ('A', 'X')])
+        diff = diff_songs(old, new)
+        self.assertEqual([e.status for e in diff.entries], [EDITED])
+        self.assertEqual(format_entry(diff.entries[0]),
+                         "~ 1. Summer Breeze - Piper (was Summer Breeze - Pipr)")
+
+    def test_edited_after_insertion(self):
+        """Test that edits are found when an insertion shifts the positions."""
+        old = make_songs([('A', 'X'), ('Summer Breeze', 'Pipr'), ('Summer Breez', 'Piper'),
+                          ('C', 'Z')])
+        new = make_collection([('New', 'W'), ('A', 'X'), ('Summer Breeze', 'Piper'),
+                               ('Summer Breeze', 'Piper'), ('C', 'Z')])
+        diff = diff_songs(old, new)
+        self.assertEqual([(e.status, e.old_index, e.new_index) for e in diff.entries],
+                         [(ADDED, None, 0), (EDITED, 1, 2), (EDITED, 2, 3)])
+        self.assertEqual([e.old_song.title for e in diff.edited], ['Summer Breeze', 'Summer Breez'])
+
+    def test_same_artist_replacement(self):
+        """Test that another track by the same artist is added and removed, not edited."""
+        old = make_songs([('A', 'X'), ('B', 'Y')])
+        new = make_collection([('C', 'X'), ('B', 'Y')])
+        diff = diff_songs(old, new)
+        self.assertEqual([(e.status, e.song.title) for e in diff.entries],
+                         [(ADDED, 'C'), (REMOVED, 'A')])
+
+    def test_saved_artists_not_registered(self):
+        """Test that comparing does not add saved-only artists to the artist table."""
+        new = make_collection([('A', 'X')])
+        artist_count = len(new.artists)
+        diff = diff_songs(make_songs([('A', 'X'), ('B', 'Old Artist feat. Z')]), new)
+        self.assertEqual([e.status for e in diff.entries], [REMOVED])
+        self.assertEqual(len(new.artists), artist_count)
+
+    def test_duplicates(self):
+        """Test that duplicate songs are matched one by one."""
+        old = make_songs([('A', 'X'), ('A', 'X')])
+        new = make_collection([('A', 'X')])
+        diff = diff_songs(old, new)
+        self.assertEqual([(e.status, e.old_index) for e in diff.entries], [(REMOVED, 1)])
+
+    def test_diff_csv_and_export_delta(self):
+        """Test comparing with a CSV file and exporting only the changes."""
+        path = self.write_csv('old.csv', [('A', 'X'), ('B', 'Y')])
+        diff = diff_csv(path, make_collection([('A', 'X'), ('C', 'Z')]))
+        delta = os.path.join(self.tmpdir.name, 'delta.csv')
+        save_delta_csv(diff, delta)
+        with open(delta, newline='', encoding='utf-8') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual([(r['TITLE'], r['STATUS']) for r in rows],
+                         [('C', ADDED), ('B', REMOVED)])
+        self.assertEqual([s.title for s in iter_csv_songs(delta)], ['C', 'B'])
+
+    def test_csv_without_columns(self):
+        """Test that a CSV without TITLE and ARTIST columns is rejected."""
+        path = os.path.join(self.tmpdir.name, 'other.csv')
+        with open(path, 'w', encoding='utf-8') as csvfile:
+            csvfile.write('Summer Breeze,Piper\nNana kinomi,Omaesan\n')
+        with self.assertRaises(ValueError):
+            diff_csv(path, make_collection([('Summer Breeze', 'Piper')]))
+
+    def test_cli_error(self):
+        """Test that the command line interface reports errors with exit code 2."""
+        new = self.write_csv('new.csv', [('A', 'X')])
+        missing = os.path.join(self.tmpdir.name, 'missing.csv')
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(main([missing, new]), 2)
+        self.assertIn('error', stderr.getvalue())
+
+    def test_cli_malformed_csv(self):
+        """Test that a malformed CSV results in exit code 2 instead of a traceback."""
+        old = self.write_csv('old.csv', [('A' * (csv.field_size_limit() + 1), 'X')])
+        new = self.write_csv('new.csv', [('A', 'X')])
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(main([old, new]), 2)
+        self.assertIn('error', stderr.getvalue())
+
+    def test_cli(self):
+        """Test the command line interface with a text tracklist."""
+        old = self.write_csv('old.csv', [('Summer Breeze', 'Piper')])
+        new = os.path.join(self.tmpdir.name, 'new.txt')
+        with open(new, 'w', encoding='utf-8') as textfile:
+            textfile.write('00:16 Summer Breeze - Piper\nNana kinomi - Omaesan\n')
+        delta = os.path.join(self.tmpdir.name, 'delta.csv')
+        self.assertEqual(main([old, new, '--quiet', '--export', delta]), 1)
+        self.assertEqual([s.title for s in iter_csv_songs(delta)], ['Nana kinomi'])
+
+    def test_large_collection(self):
+        """Test diffing large collections with a few changes."""
+        count = 100000
+        old = make_songs((f'Track {i}', f'Artist {i % 500}') for i in range(count))
+        pairs = [(f'Track {i}', f'Artist {i % 500}') for i in range(count)]
+        pairs[10] = ('New Track', 'New Artist')
+        pairs.append(pairs.pop(20))
+        diff = diff_songs(old, make_collection(pairs))
+        self.assertEqual(diff.summary(), "1 added, 1 removed, 1 moved, 0 edited")
+
+if __name__ == '__main__':
+    unittest.main()